@@ -10,12 +10,19 @@ Generates two separate registry files:
 import os
 import re
 import json
+import hashlib
 import yaml
 import glob
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from datetime import datetime
 from typing import Dict, List, Optional, Set, Tuple
 
+# Prefer the libyaml-backed loader; fall back when PyYAML was built without it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 # Configuration
 COMPONENTS_DIR = "src/ts/components/cores"
 YAML_BASE_DIR = "static/yaml"
@@ -25,72 +32,210 @@ DOMAINS_DIR = f"{YAML_BASE_DIR}/domains"
 MENUS_DIR = f"{YAML_BASE_DIR}/menus"
 YAML_REGISTRY_FILE = "static/js/yaml-registry.js"
 COMPONENT_REGISTRY_FILE = "src/ts/registry/mera-registry.ts"
+REGISTRY_CACHE_FILE = ".registry-cache.json"
+
+# YAML file categories and the directory each is listed from
+YAML_CATEGORY_DIRS = {
+    "lessons": LESSONS_DIR,
+    "curriculum": CURRICULUM_DIR,
+    "domains": DOMAINS_DIR,
+    "menus": MENUS_DIR,
+}
+
+# Large data blobs in mera-registry.ts are emitted as compact JSON
+COMPACT_JSON_SEPARATORS = (",", ":")
+
+# Cached results are only valid for the builder code that produced them, so
+# any edit to this file (patterns, required fields, summary shape) invalidates them
+REGISTRY_CACHE_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+# Stand-in for the content hash in generated headers; see stamp_content_hash()
+CONTENT_HASH_MARKER = "@@CONTENT_HASH@@"
 
-# Component discovery patterns
+# Component discovery patterns, keyed by the component_info field each one fills
 COMPONENT_PATTERNS = {
-    "component_class": r"export\s+class\s+(\w+)\s+extends\s+BaseComponentProgressManager",
-    "config_schema": r"export\s+const\s+(\w+ConfigSchema)\s*=",
-    "progress_schema": r"export\s+const\s+(\w+ProgressSchema)\s*=",
-    "component_type": r'type:\s*z\.literal\([\'"]([^\'"]+)[\'"]\)',
-    "validator_function": r"export\s+function\s+(validate\w+Structure)\s*\(",
-    "initializer_function": r"export\s+function\s+(createInitialProgress)\s*\(",
+    "componentClass": r"export\s+class\s+(?P<componentClass>\w+)\s+extends\s+BaseComponentProgressManager",
+    "configSchema": r"export\s+const\s+(?P<configSchema>\w+ConfigSchema)\s*=",
+    "progressSchema": r"export\s+const\s+(?P<progressSchema>\w+ProgressSchema)\s*=",
+    "typeName": r'type:\s*z\.literal\([\'"](?P<typeName>[^\'"]+)[\'"]\)',
+    "validatorFunction": r"export\s+function\s+(?P<validatorFunction>validate\w+Structure)\s*\(",
+    "initializerFunction": r"export\s+function\s+(?P<initializerFunction>createInitialProgress)\s*\(",
 }
 
+# All patterns fused into one alternation so each file is scanned in a single pass
+COMPONENT_SCANNER = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in COMPONENT_PATTERNS.values())
+)
+
+# Exports required for a component to be registered (validator is optional)
+REQUIRED_COMPONENT_FIELDS = ["componentClass", "configSchema", "progressSchema", "typeName", "initializerFunction"]
+
+# First read is bounded; oversized files are read in full unless every pattern matched
+SCAN_READ_CHARS = 256 * 1024
+
+# Below this many component files a process pool costs more than it saves
+PARALLEL_SCAN_MIN_FILES = 32
+
+
+def match_component_fields(content: str) -> Dict[str, str]:
+    """Collect the first match of each registration pattern in content."""
+    component_info = {}
+
+    # Cheap substring check first: files without a progress manager can't register
+    if "BaseComponentProgressManager" not in content:
+        return component_info
+
+    # Keep the first occurrence of each field, matching per-pattern re.search
+    for match in COMPONENT_SCANNER.finditer(content):
+        field = match.lastgroup
+        if field not in component_info:
+            component_info[field] = match.group(field)
+            # Every field found (including the optional validator) - stop scanning
+            if len(component_info) == len(COMPONENT_PATTERNS):
+                break
+
+    return component_info
+
 
 def scan_component_file(filepath: Path) -> Optional[Dict[str, str]]:
     """Scan a TypeScript component file for registration patterns."""
+    print(f"Scanning component: {filepath.name}...")
     try:
         with open(filepath, "r", encoding="utf-8") as f:
-            content = f.read()
+            content = f.read(SCAN_READ_CHARS)
+            component_info = match_component_fields(content)
+            # Any field missing from a truncated read (including the optional
+            # validator, usually exported last) may be further in - read the rest
+            if len(content) == SCAN_READ_CHARS and not all(
+                field in component_info for field in COMPONENT_PATTERNS
+            ):
+                content += f.read()
+                component_info = match_component_fields(content)
     except Exception as e:
         print(f"Warning: Could not read {filepath}: {e}")
         return None
 
-    component_info = {}
-
-    for pattern_name, pattern in COMPONENT_PATTERNS.items():
-        match = re.search(pattern, content)
-        if match:
-            if pattern_name == "component_type":
-                component_info["typeName"] = match.group(1)
-            elif pattern_name == "component_class":
-                component_info["componentClass"] = match.group(1)
-            elif pattern_name == "config_schema":
-                component_info["configSchema"] = match.group(1)
-            elif pattern_name == "progress_schema":
-                component_info["progressSchema"] = match.group(1)
-            elif pattern_name == "validator_function":
-                component_info["validatorFunction"] = match.group(1)
-            elif pattern_name == "initializer_function":
-                component_info["initializerFunction"] = match.group(1)
-
-    required_fields = ["componentClass", "configSchema", "progressSchema", "typeName", "initializerFunction"]
-    if all(field in component_info for field in required_fields):
+    if all(field in component_info for field in REQUIRED_COMPONENT_FIELDS):
         component_info["file"] = filepath.stem
         # Validator function is optional (not all components have it yet)
         if "validatorFunction" not in component_info:
             print(f"  ⚠️  No validator function found (this is okay for now)")
         return component_info
     else:
-        missing = [field for field in required_fields if field not in component_info]
+        missing = [field for field in REQUIRED_COMPONENT_FIELDS if field not in component_info]
         print(f"Warning: {filepath.name} missing required exports: {missing}")
         return None
 
 
-def discover_components() -> List[Dict[str, str]]:
-    """Discover all component files in the components directory."""
+def load_registry_cache() -> Dict:
+    """Load scan results cached by a previous run.
+
+    Empty if missing, unreadable or written by a different builder version.
+    Individual entries are still validated where they are used.
+    """
+    try:
+        with open(REGISTRY_CACHE_FILE, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != REGISTRY_CACHE_VERSION:
+        return {}
+    return cache
+
+
+def save_registry_cache(cache: Dict) -> None:
+    """Atomically write the registry cache; a failed write only costs a rescan."""
+    cache["version"] = REGISTRY_CACHE_VERSION
+    tmp_path = f"{REGISTRY_CACHE_FILE}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, REGISTRY_CACHE_FILE)
+    except (OSError, TypeError, ValueError) as e:
+        # TypeError/ValueError: a YAML value with no JSON equivalent
+        print(f"Warning: Could not write registry cache: {e}")
+
+
+def is_fresh_component_scan(entry, fingerprint: List[int]) -> bool:
+    """Check a cached component scan matches the file and is well-formed."""
+    if not isinstance(entry, dict) or entry.get("fingerprint") != fingerprint or "info" not in entry:
+        return False
+    info = entry["info"]
+    # None records a file that was scanned and skipped
+    if info is None:
+        return True
+    return isinstance(info, dict) and all(
+        isinstance(info.get(field), str) for field in REQUIRED_COMPONENT_FIELDS + ["file"]
+    )
+
+
+def discover_components(cache: Optional[Dict] = None) -> List[Dict[str, str]]:
+    """Discover all component files in the components directory.
+
+    If a cache dict is given, files whose (mtime, size) match a previous scan
+    reuse that result, and the cache is updated in place for the next run.
+    """
     components_path = Path(COMPONENTS_DIR)
     if not components_path.exists():
         print(f"Warning: Components directory {COMPONENTS_DIR} not found")
         return []
 
+    # scandir gives names without building a Path for every directory entry
+    with os.scandir(components_path) as it:
+        ts_entries = sorted(
+            (
+                entry
+                for entry in it
+                if entry.name.endswith(".ts")
+                and entry.name != "baseComponentCore.ts"
+                and entry.is_file()
+            ),
+            key=lambda entry: entry.name,
+        )
+    ts_files = [Path(entry.path) for entry in ts_entries]
+
+    if cache is None:
+        cache = {}
+    previous_scans = cache.get("components")
+    if not isinstance(previous_scans, dict):
+        previous_scans = {}
+
+    fingerprints = {}
+    cached_results = {}
+    for ts_file, dir_entry in zip(ts_files, ts_entries):
+        stat = dir_entry.stat()
+        fingerprints[ts_file] = [stat.st_mtime_ns, stat.st_size]
+        entry = previous_scans.get(ts_file.as_posix())
+        # Anything malformed is treated as a cache miss and rescanned
+        if is_fresh_component_scan(entry, fingerprints[ts_file]):
+            cached_results[ts_file] = entry["info"]
+
+    stale_files = [ts_file for ts_file in ts_files if ts_file not in cached_results]
+
+    if len(stale_files) >= PARALLEL_SCAN_MIN_FILES:
+        # Each file is scanned independently, so spread the regex work across cores
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(scan_component_file, stale_files, chunksize=8)
+            scanned_results = dict(zip(stale_files, results))
+    else:
+        scanned_results = {}
+
     discovered_components = []
+    current_scans = {}
+
+    for ts_file in ts_files:
+        if ts_file in cached_results:
+            print(f"Scanning component: {ts_file.name}... (cached)")
+            component_info = cached_results[ts_file]
+        elif ts_file in scanned_results:
+            component_info = scanned_results[ts_file]
+        else:
+            component_info = scan_component_file(ts_file)
 
-    for ts_file in components_path.glob("*.ts"):
-        if ts_file.stem == "baseComponentCore":
-            continue
-        print(f"Scanning component: {ts_file.name}...")
-        component_info = scan_component_file(ts_file)
+        current_scans[ts_file.as_posix()] = {
+            "fingerprint": fingerprints[ts_file],
+            "info": dict(component_info) if component_info else None,
+        }
 
         if component_info:
             discovered_components.append(component_info)
@@ -98,20 +243,54 @@ def discover_components() -> List[Dict[str, str]]:
         else:
             print(f"  ⚠️ Skipped: {ts_file.name}")
 
+    cache["components"] = current_scans
+
+    # glob order is filesystem-dependent; sort so generated output is stable
+    discovered_components.sort(key=lambda component: component["typeName"])
+
     return discovered_components
 
 
+def list_yaml_files(directory: str) -> List[Path]:
+    """List *.yaml files in a directory with os.scandir (empty if it doesn't exist).
+
+    Sorted by name: scandir order is filesystem-dependent, and it decides the
+    order of every generated list built from these files.
+    """
+    try:
+        with os.scandir(directory) as it:
+            names = sorted(
+                entry.name
+                for entry in it
+                # Match glob("*.yaml"), which skips dotfiles
+                if entry.name.endswith(".yaml")
+                and not entry.name.startswith(".")
+                and entry.is_file()
+            )
+    except FileNotFoundError:
+        return []
+    return [Path(directory) / name for name in names]
+
+
+def discover_yaml_files() -> Dict[str, List[Path]]:
+    """List each YAML category directory once; later phases reuse the lists."""
+    return {
+        category: list_yaml_files(directory)
+        for category, directory in YAML_CATEGORY_DIRS.items()
+    }
+
+
 def scan_yaml_files_in_directory(
-    directory: str, file_type: str
+    directory: str, file_type: str, yaml_paths: List[Path]
 ) -> List[Dict[str, str]]:
-    """Scan YAML files in a directory and return file info."""
+    """Build file info for the YAML files already listed from a directory."""
     dir_path = Path(directory)
     if not dir_path.exists():
         print(f"Warning: Directory {directory} not found")
         return []
 
     files = []
-    for yaml_file in dir_path.glob("*.yaml"):
+    for yaml_file in yaml_paths:
         # Create absolute path from domain root by adding leading slash
         relative_path = yaml_file.relative_to(".").as_posix()
         file_info = {
@@ -125,15 +304,15 @@ def scan_yaml_files_in_directory(
     return files
 
 
-def scan_all_yaml_files() -> Dict[str, List[Dict[str, str]]]:
+def scan_all_yaml_files(yaml_paths: Dict[str, List[Path]]) -> Dict[str, List[Dict[str, str]]]:
     """Scan all YAML directories and return file lists."""
     print("Scanning YAML directories...")
 
     yaml_files = {
-        "lessons": scan_yaml_files_in_directory(LESSONS_DIR, "lesson"),
-        "curriculum": scan_yaml_files_in_directory(CURRICULUM_DIR, "curriculum"),
-        "domains": scan_yaml_files_in_directory(DOMAINS_DIR, "domain"),
-        "menus": scan_yaml_files_in_directory(MENUS_DIR, "menu"),
+        "lessons": scan_yaml_files_in_directory(LESSONS_DIR, "lesson", yaml_paths["lessons"]),
+        "curriculum": scan_yaml_files_in_directory(CURRICULUM_DIR, "curriculum", yaml_paths["curriculum"]),
+        "domains": scan_yaml_files_in_directory(DOMAINS_DIR, "domain", yaml_paths["domains"]),
+        "menus": scan_yaml_files_in_directory(MENUS_DIR, "menu", yaml_paths["menus"]),
     }
 
     total = sum(len(files) for files in yaml_files.values())
@@ -142,17 +321,99 @@ def scan_all_yaml_files() -> Dict[str, List[Dict[str, str]]]:
     return yaml_files
 
 
-def parse_entity_yaml(yaml_file: Path, entity_type: str) -> Optional[Dict]:
-    """Parse a single entity (lesson or menu) YAML file."""
+# Parsed YAML documents keyed by (path, mtime_ns, size)
+PARSED_YAML_CACHE: Dict[Tuple[str, int, int], object] = {}
+
+
+def yaml_cache_key(yaml_file: Path) -> Tuple[str, int, int]:
+    """Identify a YAML file's current contents for PARSED_YAML_CACHE."""
+    stat = yaml_file.stat()
+    return (str(yaml_file), stat.st_mtime_ns, stat.st_size)
+
+
+def read_yaml_file(yaml_file: Path):
+    """Parse a YAML file from disk, bypassing the cache."""
+    # The loader decodes bytes itself (UTF-8 unless a BOM says otherwise)
+    return yaml.load(yaml_file.read_bytes(), Loader=YamlLoader)
+
+
+def load_yaml_file(yaml_file: Path):
+    """Load a YAML file, reusing the earlier parse if the file is unchanged."""
+    key = yaml_cache_key(yaml_file)
+    if key not in PARSED_YAML_CACHE:
+        PARSED_YAML_CACHE[key] = read_yaml_file(yaml_file)
+    return PARSED_YAML_CACHE[key]
+
+
+def restore_yaml_documents(cache: Dict) -> None:
+    """Seed PARSED_YAML_CACHE with documents kept in the registry cache."""
+    documents = cache.get("yamlDocuments")
+    if not isinstance(documents, dict):
+        return
+
+    for path, entry in documents.items():
+        # Malformed entries are skipped; their files are simply parsed again
+        if not isinstance(entry, dict) or "data" not in entry:
+            continue
+        fingerprint = entry.get("fingerprint")
+        if not (
+            isinstance(fingerprint, list)
+            and len(fingerprint) == 2
+            and all(isinstance(value, int) for value in fingerprint)
+        ):
+            continue
+        mtime_ns, size = fingerprint
+        PARSED_YAML_CACHE[(path, mtime_ns, size)] = entry["data"]
+
+
+def remember_yaml_documents(cache: Dict, yaml_files: List[Path]) -> None:
+    """Keep the parsed documents of yaml_files in the registry cache.
+
+    Only for files that are emitted as JSON anyway (domains, curriculum), so
+    the JSON round trip can't change the generated output.
+    """
+    documents = {}
+    for yaml_file in yaml_files:
+        key = yaml_cache_key(yaml_file)
+        if key in PARSED_YAML_CACHE:
+            documents[key[0]] = {"fingerprint": [key[1], key[2]], "data": PARSED_YAML_CACHE[key]}
+    cache["yamlDocuments"] = documents
+
+
+def preload_yaml_files(yaml_files: List[Path]) -> None:
+    """Parse many YAML files across cores, seeding PARSED_YAML_CACHE.
+
+    Callers still go through load_yaml_file in their usual order, so error
+    reporting and conflict checks stay sequential and deterministic.
+    """
+    stale = {}
+    for yaml_file in yaml_files:
+        key = yaml_cache_key(yaml_file)
+        if key not in PARSED_YAML_CACHE:
+            stale[key] = yaml_file
+
+    if len(stale) < PARALLEL_SCAN_MIN_FILES:
+        return
+
+    with ProcessPoolExecutor() as executor:
+        futures = {key: executor.submit(read_yaml_file, path) for key, path in stale.items()}
+
+    for key, future in futures.items():
+        # Failed parses are left for load_yaml_file to retry and report
+        if future.exception() is None:
+            PARSED_YAML_CACHE[key] = future.result()
+
+
+def parse_entity_yaml(yaml_file: Path, entity_type: str) -> Tuple[Optional[Dict], List[List]]:
+    """Parse an entity (lesson or menu) file into its metadata and [component id, type] pairs."""
     try:
-        with open(yaml_file, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = load_yaml_file(yaml_file)
 
         metadata = data.get("metadata", {})
         entity_id = metadata.get("id")
 
         if entity_id is None:  # ← Allows 0 but catches missing ID
-            return None
+            return None, []
 
         pages = data.get("pages", [])
         total_components = sum(len(page.get("components", [])) for page in pages)
@@ -173,35 +434,155 @@ def parse_entity_yaml(yaml_file: Path, entity_type: str) -> Optional[Dict]:
         if entity_type == "lesson":
             entity_info["domainId"] = metadata.get("domainId")
 
-        return entity_info
-
     except Exception as e:
         print(f"  ❌ Error parsing {yaml_file.name}: {e}")
-        return None
+        return None, []
+
+    # Deliberately outside the try: a malformed component entry must fail the
+    # build rather than silently drop the whole entity from the registry
+    components = []
+    for page in pages:
+        for component in page.get("components", []):
+            comp_id = component.get("id")
+            comp_type = component.get("type")
+            if comp_id and comp_type:
+                components.append([comp_id, comp_type])
 
+    return entity_info, components
 
-def parse_domains() -> List[Dict]:
+
+def parse_domains(domain_files: List[Path]) -> List[Dict]:
     """Parse domain YAML files."""
-    domains_path = Path(DOMAINS_DIR)
-    if not domains_path.exists():
-        return []
+    preload_yaml_files(domain_files)
 
     domains = []
-    for yaml_file in domains_path.glob("*.yaml"):
+    for yaml_file in domain_files:
         try:
-            with open(yaml_file, "r", encoding="utf-8") as f:
-                domain_data = yaml.safe_load(f)
-                domains.append(domain_data)
+            domains.append(load_yaml_file(yaml_file))
         except Exception as e:
             print(f"❌ Error parsing domain {yaml_file.name}: {e}")
 
     return domains
 
 
-def parse_all_entities(domains: List[Dict]) -> Tuple[List[Dict], Set[int], Set[int], Dict[int, List[int]], Dict[int, str], Dict[int, int]]:
+# Keys parse_entity_yaml always sets (lessons also carry domainId)
+ENTITY_SUMMARY_FIELDS = [
+    "id", "path", "title", "entityType", "pageCount", "componentCount",
+    "difficulty", "estimatedMinutes", "required",
+]
+
+
+def is_fresh_entity_summary(entry, fingerprint: List) -> bool:
+    """Check a cached entity summary matches the file and is well-formed."""
+    if not isinstance(entry, dict) or entry.get("fingerprint") != fingerprint:
+        return False
+    entity = entry.get("entity")
+    components = entry.get("components")
+    if not isinstance(entity, dict) or not all(field in entity for field in ENTITY_SUMMARY_FIELDS):
+        return False
+    return isinstance(components, list) and all(
+        isinstance(pair, list) and len(pair) == 2 and pair[0] and pair[1]
+        for pair in components
+    )
+
+
+def summarize_entity_files(
+    entity_files: List[Tuple[Path, str]], cache: Optional[Dict] = None
+) -> Dict[Path, Tuple[Optional[Dict], List[List]]]:
+    """Summarize (path, entity type) pairs, reusing cached summaries where fresh."""
+    if cache is None:
+        cache = {}
+    previous_summaries = cache.get("entities")
+    if not isinstance(previous_summaries, dict):
+        previous_summaries = {}
+
+    fingerprints = {}
+    summaries = {}
+    for yaml_file, entity_type in entity_files:
+        stat = yaml_file.stat()
+        fingerprints[yaml_file] = [entity_type, stat.st_mtime_ns, stat.st_size]
+        entry = previous_summaries.get(yaml_file.as_posix())
+        # Anything malformed is treated as a cache miss and re-parsed
+        if is_fresh_entity_summary(entry, fingerprints[yaml_file]):
+            summaries[yaml_file] = (entry["entity"], entry["components"])
+
+    preload_yaml_files([f for f, _ in entity_files if f not in summaries])
+
+    current_summaries = {}
+    for yaml_file, entity_type in entity_files:
+        if yaml_file not in summaries:
+            summaries[yaml_file] = parse_entity_yaml(yaml_file, entity_type)
+
+        entity_info, components = summaries[yaml_file]
+        # Failed parses aren't cached so their errors are reported every run
+        if entity_info:
+            current_summaries[yaml_file.as_posix()] = {
+                "fingerprint": fingerprints[yaml_file],
+                "entity": dict(entity_info),
+                "components": components,
+            }
+
+    cache["entities"] = current_summaries
+    return summaries
+
+
+def ingest_entity_components(
+    components: List[List],
+    entity_id: int,
+    entity_type: str,
+    component_ids: Set[int],
+    component_id_to_type: Dict[int, str],
+    component_to_lesson_map: Dict[int, int],
+) -> None:
+    """Record an entity's components, raising on type or ownership conflicts."""
+    for comp_id, comp_type in components:
+        component_ids.add(comp_id)
+
+        # Store the type mapping - FAIL on conflict
+        existing_type = component_id_to_type.get(comp_id)
+        if existing_type is None:
+            component_id_to_type[comp_id] = comp_type
+        elif existing_type != comp_type:
+            raise ValueError(
+                f"FATAL: Component ID {comp_id} has conflicting types!\n"
+                f"  Found: {comp_type}\n"
+                f"  Existing: {existing_type}\n"
+                f"  Each component ID must have exactly ONE type."
+            )
+
+        # Build reverse index (menus share it with lessons)
+        previous_entity = component_to_lesson_map.get(comp_id)
+        if previous_entity is not None:
+            if entity_type == "lesson":
+                raise ValueError(
+                    f"FATAL: Component ID {comp_id} appears in multiple lessons!\n"
+                    f"  Current lesson: {entity_id}\n"
+                    f"  Previous lesson: {previous_entity}\n"
+                    f"  Each component must belong to exactly ONE lesson."
+                )
+            raise ValueError(
+                f"FATAL: Component ID {comp_id} appears in multiple entities!\n"
+                f"  Current menu: {entity_id}\n"
+                f"  Previous entity: {previous_entity}\n"
+                f"  Each component must belong to exactly ONE entity."
+            )
+        component_to_lesson_map[comp_id] = entity_id
+
+
+def parse_all_entities(
+    domains: List[Dict],
+    lesson_files: List[Path],
+    menu_files: List[Path],
+    cache: Optional[Dict] = None,
+) -> Tuple[List[Dict], Set[int], Set[int], Dict[int, List[int]], Dict[int, str], Dict[int, int]]:
     """Parse all entity YAML files (lessons and menus).
     
-    UPDATED: Now accepts domains list to pre-initialize domain_lesson_map.
+    UPDATED: Now accepts domains list to pre-initialize domain_lesson_map,
+    and the lesson/menu files already listed by discover_yaml_files().
+
+    If a cache dict is given, files whose (mtime, size) match a previous run
+    reuse that run's summary instead of being parsed, and the cache is
+    updated in place for the next run.
     
     Returns:
         - all_entities: List of entity metadata
@@ -225,129 +606,69 @@ def parse_all_entities(domains: List[Dict]) -> Tuple[List[Dict], Set[int], Set[i
         if domain_id is not None:
             domain_lesson_map[domain_id] = []
 
-    # Parse lesson entities
-    lessons_path = Path(LESSONS_DIR)
-    if lessons_path.exists():
-        for yaml_file in lessons_path.glob("*.yaml"):
-            entity_info = parse_entity_yaml(yaml_file, "lesson")
-            if not entity_info:
-                continue
-
-            entity_id = entity_info["id"]
-            if entity_id in entity_ids:
-                print(f"  ❌ Error: Duplicate entity ID {entity_id}")
-                continue
-
-            entity_ids.add(entity_id)
-            all_entities.append(entity_info)
-
-            # Collect component IDs AND types
-            with open(yaml_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-                for page in data.get("pages", []):
-                    for component in page.get("components", []):
-                        comp_id = component.get("id")
-                        comp_type = component.get("type")
-                        if comp_id and comp_type:
-                            component_ids.add(comp_id)
-                            # Store the type mapping - FAIL on conflict
-                            if comp_id in component_id_to_type and component_id_to_type[comp_id] != comp_type:
-                                raise ValueError(
-                                    f"FATAL: Component ID {comp_id} has conflicting types!\n"
-                                    f"  Found: {comp_type}\n"
-                                    f"  Existing: {component_id_to_type[comp_id]}\n"
-                                    f"  Each component ID must have exactly ONE type."
-                                )
-                            component_id_to_type[comp_id] = comp_type
-                            
-                            # Build reverse index
-                            if comp_id in component_to_lesson_map:
-                                raise ValueError(
-                                    f"FATAL: Component ID {comp_id} appears in multiple lessons!\n"
-                                    f"  Current lesson: {entity_id}\n"
-                                    f"  Previous lesson: {component_to_lesson_map[comp_id]}\n"
-                                    f"  Each component must belong to exactly ONE lesson."
-                                )
-                            component_to_lesson_map[comp_id] = entity_id
-
-            # Track domain-to-lesson mapping
-            domain_id = entity_info.get("domainId")
-            if domain_id is not None:
-                if domain_id not in domain_lesson_map:
-                    domain_lesson_map[domain_id] = []
-                domain_lesson_map[domain_id].append(entity_id)
-
-    # Parse menu entities
-    menus_path = Path(MENUS_DIR)
-    if menus_path.exists():
-        for yaml_file in menus_path.glob("*.yaml"):
-            entity_info = parse_entity_yaml(yaml_file, "menu")
-            if not entity_info:
-                continue
-
-            entity_id = entity_info["id"]
-            if entity_id in entity_ids:
-                print(f"  ❌ Error: Duplicate entity ID {entity_id}")
-                continue
-
-            entity_ids.add(entity_id)
-            all_entities.append(entity_info)
-
-            # Collect component IDs AND types from menus
-            with open(yaml_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-                for page in data.get("pages", []):
-                    for component in page.get("components", []):
-                        comp_id = component.get("id")
-                        comp_type = component.get("type")
-                        if comp_id and comp_type:
-                            component_ids.add(comp_id)
-                            if comp_id in component_id_to_type and component_id_to_type[comp_id] != comp_type:
-                                raise ValueError(
-                                    f"FATAL: Component ID {comp_id} has conflicting types!\n"
-                                    f"  Found: {comp_type}\n"
-                                    f"  Existing: {component_id_to_type[comp_id]}\n"
-                                    f"  Each component ID must have exactly ONE type."
-                                )
-                            component_id_to_type[comp_id] = comp_type
-                            
-                            # Menus also need reverse index
-                            if comp_id in component_to_lesson_map:
-                                raise ValueError(
-                                    f"FATAL: Component ID {comp_id} appears in multiple entities!\n"
-                                    f"  Current menu: {entity_id}\n"
-                                    f"  Previous entity: {component_to_lesson_map[comp_id]}\n"
-                                    f"  Each component must belong to exactly ONE entity."
-                                )
-                            component_to_lesson_map[comp_id] = entity_id
+    entity_files = [(f, "lesson") for f in lesson_files] + [(f, "menu") for f in menu_files]
+    summaries = summarize_entity_files(entity_files, cache)
+
+    # Parse lesson entities, then menu entities
+    for yaml_file, entity_type in entity_files:
+        entity_info, components = summaries[yaml_file]
+        if not entity_info:
+            continue
+
+        entity_id = entity_info["id"]
+        if entity_id in entity_ids:
+            print(f"  ❌ Error: Duplicate entity ID {entity_id}")
+            continue
+
+        entity_ids.add(entity_id)
+        all_entities.append(entity_info)
+
+        # Collect component IDs AND types
+        ingest_entity_components(
+            components,
+            entity_id,
+            entity_type,
+            component_ids,
+            component_id_to_type,
+            component_to_lesson_map,
+        )
+
+        # Track domain-to-lesson mapping (menus have no domainId)
+        domain_id = entity_info.get("domainId")
+        if domain_id is not None:
+            domain_lesson_map.setdefault(domain_id, []).append(entity_id)
 
     return all_entities, entity_ids, component_ids, domain_lesson_map, component_id_to_type, component_to_lesson_map
 
 
-def parse_curriculum() -> Optional[Dict]:
+def parse_curriculum(curriculum_files: List[Path]) -> Optional[Dict]:
     """Parse curriculum YAML file (if it exists)."""
-    curriculum_path = Path(CURRICULUM_DIR)
-    if not curriculum_path.exists():
-        return None
-
-    yaml_files = list(curriculum_path.glob("*.yaml"))
-    if not yaml_files:
+    if not curriculum_files:
         return None
 
     try:
-        with open(yaml_files[0], "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+        return load_yaml_file(curriculum_files[0])
     except Exception as e:
         print(f"❌ Error parsing curriculum: {e}")
         return None
 
 
+def stamp_content_hash(content: str) -> str:
+    """Replace the header marker with a hash of the generated content.
+
+    Unlike a timestamp, the hash only changes when the output does, so
+    identical inputs produce byte-identical registry files.
+    """
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+    return content.replace(CONTENT_HASH_MARKER, digest, 1)
+
+
 def generate_yaml_registry(yaml_files: Dict[str, List[Dict[str, str]]]) -> str:
     """Generate simple YAML registry with just file paths for loading."""
 
-    return f"""/*
+    return stamp_content_hash(f"""/*
  * Auto-generated YAML File Registry for Runtime Loading
- * Generated on: {datetime.now().isoformat()}
+ * Content hash: {CONTENT_HASH_MARKER}
  * 
  * This file contains ONLY file paths for loading YAML content at runtime.
  * All parsed data and mappings are in mera-registry.ts (bundled with TypeScript).
@@ -387,7 +708,7 @@ export const allYamlFiles = [
 ];
 
 console.log(`YAML File Registry loaded: ${{allYamlFiles.length}} files to load`);
-"""
+""")
 
 
 def generate_component_registry(
@@ -404,24 +725,34 @@ def generate_component_registry(
     """Generate complete TypeScript registry with all 12 mappings."""
     imports = []
     registrations = []
+    component_type_entries = []
+    config_schema_entries = []
+    progress_schema_entries = []
+    validator_entries = []
+    initializer_entries = []
 
+    # Single pass over components fills every per-component section
     for component in components:
+        type_name = component['typeName']
         imports_list = [
             component['componentClass'],
             component['configSchema'],
             component['progressSchema']
         ]
         # Add validator function if it exists
-        if 'validatorFunction' in component:
-            imports_list.append(component['validatorFunction'])
+        validator = component.get('validatorFunction')
+        if validator:
+            imports_list.append(validator)
+            validator_entries.append(f'    ["{type_name}", {validator}]')
         
         # Add initializer function with alias to avoid name collision
-        if 'initializerFunction' in component:
-            # Create unique alias based on component class name
-            base_name = component['componentClass'].replace('ProgressManager', '')
-            alias = f"createInitial{base_name}Progress"
-            imports_list.append(f"{component['initializerFunction']} as {alias}")
-            component['initializerFunctionAlias'] = alias
+        # (always present - discovery rejects components without one)
+        # Create unique alias based on component class name
+        base_name = component['componentClass'].replace('ProgressManager', '')
+        alias = f"createInitial{base_name}Progress"
+        imports_list.append(f"{component['initializerFunction']} as {alias}")
+        component['initializerFunctionAlias'] = alias
+        initializer_entries.append(f'    ["{type_name}", {alias}]')
         
         import_stmt = f"""import {{ 
     {', '.join(imports_list)}
@@ -432,75 +763,52 @@ def generate_component_registry(
         componentClass: {component['componentClass']},
         configSchema: {component['configSchema']},
         progressSchema: {component['progressSchema']},
-        typeName: '{component['typeName']}'
+        typeName: '{type_name}'
     }}"""
         registrations.append(registration)
 
-    imports_code = "\n".join(imports) if imports else "// No components discovered yet"
-    registrations_code = ",\n".join(registrations) if registrations else ""
-
-    component_type_entries = []
-    for comp in components:
-        entry = f'    ["{comp["typeName"]}", {comp["componentClass"]}]'
-        component_type_entries.append(entry)
-    component_type_content = ",\n".join(component_type_entries) if component_type_entries else ""
+        component_type_entries.append(f'    ["{type_name}", {component["componentClass"]}]')
+        config_schema_entries.append(f'    ["{type_name}", {component["configSchema"]}]')
+        progress_schema_entries.append(f'    ["{type_name}", {component["progressSchema"]}]')
 
-    config_schema_entries = []
-    for comp in components:
-        entry = f'    ["{comp["typeName"]}", {comp["configSchema"]}]'
-        config_schema_entries.append(entry)
-    config_schema_content = ",\n".join(config_schema_entries) if config_schema_entries else ""
-
-    progress_schema_entries = []
-    for comp in components:
-        entry = f'    ["{comp["typeName"]}", {comp["progressSchema"]}]'
-        progress_schema_entries.append(entry)
-    progress_schema_content = ",\n".join(progress_schema_entries) if progress_schema_entries else ""
-
-    validator_entries = []
-    for comp in components:
-        if 'validatorFunction' in comp:
-            entry = f'    ["{comp["typeName"]}", {comp["validatorFunction"]}]'
-            validator_entries.append(entry)
-    validator_content = ",\n".join(validator_entries) if validator_entries else ""
-
-    initializer_entries = []
-    for comp in components:
-        if 'initializerFunctionAlias' in comp:
-            entry = f'    ["{comp["typeName"]}", {comp["initializerFunctionAlias"]}]'
-            initializer_entries.append(entry)
-    initializer_content = ",\n".join(initializer_entries) if initializer_entries else ""
+    imports_code = "\n".join(imports) if imports else "// No components discovered yet"
+    registrations_code = ",\n".join(registrations)
+    component_type_content = ",\n".join(component_type_entries)
+    config_schema_content = ",\n".join(config_schema_entries)
+    progress_schema_content = ",\n".join(progress_schema_entries)
+    validator_content = ",\n".join(validator_entries)
+    initializer_content = ",\n".join(initializer_entries)
 
     entity_metrics_entries = []
     for entity in entities:
-        entry = f'    [{entity["id"]}, {{ pageCount: {entity["pageCount"]}, componentCount: {entity["componentCount"]}, title: "{entity["title"]}", difficulty: "{entity.get("difficulty", "beginner")}" }}]'
+        entry = f'    [{entity["id"]}, {{ pageCount: {entity["pageCount"]}, componentCount: {entity["componentCount"]}, title: {json.dumps(entity["title"])}, difficulty: {json.dumps(entity.get("difficulty", "beginner"))} }}]'
         entity_metrics_entries.append(entry)
-    entity_metrics_content = ",\n".join(entity_metrics_entries) if entity_metrics_entries else ""
+    entity_metrics_content = ",\n".join(entity_metrics_entries)
 
     domain_lesson_entries = []
     for domain_id, lesson_list in domain_lesson_map.items():
         entry = f"    [{domain_id}, {json.dumps(lesson_list)}]"
         domain_lesson_entries.append(entry)
-    domain_lesson_content = ",\n".join(domain_lesson_entries) if domain_lesson_entries else ""
+    domain_lesson_content = ",\n".join(domain_lesson_entries)
 
     component_id_to_type_entries = []
-    for comp_id, comp_type in sorted(component_id_to_type.items()):
-        entry = f'    [{comp_id}, "{comp_type}"]'
+    for comp_id in sorted(component_id_to_type):
+        entry = f'    [{comp_id}, {json.dumps(component_id_to_type[comp_id])}]'
         component_id_to_type_entries.append(entry)
-    component_id_to_type_content = ",\n".join(component_id_to_type_entries) if component_id_to_type_entries else ""
+    component_id_to_type_content = ",\n".join(component_id_to_type_entries)
 
     component_to_lesson_entries = []
-    for comp_id, lesson_id in sorted(component_to_lesson_map.items()):
-        entry = f'    [{comp_id}, {lesson_id}]'
+    for comp_id in sorted(component_to_lesson_map):
+        entry = f'    [{comp_id}, {component_to_lesson_map[comp_id]}]'
         component_to_lesson_entries.append(entry)
-    component_to_lesson_content = ",\n".join(component_to_lesson_entries) if component_to_lesson_entries else ""
+    component_to_lesson_content = ",\n".join(component_to_lesson_entries)
 
-    entity_ids_array = json.dumps(sorted(list(entity_ids)))
-    component_ids_array = json.dumps(sorted(list(component_ids)))
+    entity_ids_array = json.dumps(sorted(entity_ids))
+    component_ids_array = json.dumps(sorted(component_ids))
 
-    return f"""/*
+    return stamp_content_hash(f"""/*
  * Auto-generated Complete Registry for TypeScript Bundling
- * Generated on: {datetime.now().isoformat()}
+ * Content hash: {CONTENT_HASH_MARKER}
  * 
  * This file contains ALL 12 mappings and parsed YAML data.
  * Gets bundled into mera-app.js via TypeScript compilation.
@@ -612,7 +920,7 @@ export const domainLessonMap = new Map<number, number[]>([
  * MAPPING 10: Curriculum Data
  * Complete parsed curriculum structure
  */
-const curriculumDataRaw = {json.dumps(curriculum, indent=2) if curriculum else 'null'};
+const curriculumDataRaw = {json.dumps(curriculum, separators=COMPACT_JSON_SEPARATORS) if curriculum else 'null'};
 
 /**
  * Curriculum Registry - provides methods for querying curriculum data
@@ -696,13 +1004,20 @@ export const curriculumData = new CurriculumRegistry(
  * MAPPING 11: Domain Data
  * Array of all domain definitions
  */
-export const domainData = {json.dumps(domains, indent=2)};
+export const domainData = {json.dumps(domains, separators=COMPACT_JSON_SEPARATORS)};
+
+/**
+ * Domain definitions keyed by domain ID (same objects as domainData)
+ */
+export const domainDataMap = new Map<number, any>(
+  domainData.map((domain: any) => [domain.id, domain])
+);
 
 /**
  * MAPPING 12: Entity Metadata
  * Complete metadata for all entities (lessons and menus)
  */
-export const lessonMetadata = {json.dumps(entities, indent=2)};
+export const lessonMetadata = {json.dumps(entities, separators=COMPACT_JSON_SEPARATORS)};
 
 console.log(`Mera Registry loaded with all 12 mappings:`);
 console.log(`  - ${{componentRegistrations.length}} component types`);
@@ -710,18 +1025,41 @@ console.log(`  - ${{allLessonIds.length}} entities (lessons + menus)`);
 console.log(`  - ${{allComponentIds.length}} component IDs`);
 console.log(`  - ${{componentIdToTypeMap.size}} component ID->type mappings`);
 console.log(`  - ${{domainLessonMap.size}} domains`);
-"""
+""")
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write content to path unless the file already holds exactly that text.
+
+    Leaving an up-to-date file untouched keeps its mtime stable, so watchers
+    and bundlers downstream don't rebuild for nothing.
+
+    Content is encoded once and compared/written as raw bytes, so output
+    always uses LF line endings regardless of platform.
+
+    Returns True if the file was written, False if it was already current.
+    """
+    data = content.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+
+    path.write_bytes(data)
+    return True
 
 
 def write_registry_files(yaml_content: str, component_content: str) -> bool:
-    """Write both registry files."""
+    """Write both registry files, skipping any whose content is unchanged."""
     yaml_path = Path(YAML_REGISTRY_FILE)
     yaml_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        with open(yaml_path, "w", encoding="utf-8") as f:
-            f.write(yaml_content)
-        print(f"✅ YAML registry written to: {yaml_path}")
+        if write_if_changed(yaml_path, yaml_content):
+            print(f"✅ YAML registry written to: {yaml_path}")
+        else:
+            print(f"✅ YAML registry unchanged: {yaml_path}")
     except Exception as e:
         print(f"❌ Failed to write YAML registry: {e}")
         return False
@@ -730,9 +1068,10 @@ def write_registry_files(yaml_content: str, component_content: str) -> bool:
     component_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        with open(component_path, "w", encoding="utf-8") as f:
-            f.write(component_content)
-        print(f"✅ Component registry written to: {component_path}")
+        if write_if_changed(component_path, component_content):
+            print(f"✅ Component registry written to: {component_path}")
+        else:
+            print(f"✅ Component registry unchanged: {component_path}")
     except Exception as e:
         print(f"❌ Failed to write component registry: {e}")
         return False
@@ -743,18 +1082,24 @@ def write_registry_files(yaml_content: str, component_content: str) -> bool:
 def main():
     """Main execution function."""
     print("🚀 Generating Mera platform registries...")
+    cache = load_registry_cache()
+    restore_yaml_documents(cache)
 
     print("\n📦 Phase 1: Component Discovery")
-    components = discover_components()
+    components = discover_components(cache)
 
     print("\n📂 Phase 2: YAML File Discovery")
-    yaml_files = scan_all_yaml_files()
+    yaml_paths = discover_yaml_files()
+    yaml_files = scan_all_yaml_files(yaml_paths)
 
     print("\n📚 Phase 3: YAML Content Parsing")
     # CONSERVATIVE FIX: Parse domains first, pass to parse_all_entities
-    domains = parse_domains()
-    entities, entity_ids, component_ids, domain_lesson_map, component_id_to_type, component_to_lesson_map = parse_all_entities(domains)
-    curriculum = parse_curriculum()
+    domains = parse_domains(yaml_paths["domains"])
+    entities, entity_ids, component_ids, domain_lesson_map, component_id_to_type, component_to_lesson_map = parse_all_entities(
+        domains, yaml_paths["lessons"], yaml_paths["menus"], cache
+    )
+    curriculum = parse_curriculum(yaml_paths["curriculum"])
+    remember_yaml_documents(cache, yaml_paths["domains"] + yaml_paths["curriculum"][:1])
 
     print("\n🗃️ Generating registry files...")
     yaml_registry = generate_yaml_registry(yaml_files)
@@ -771,6 +1116,7 @@ def main():
     )
 
     success = write_registry_files(yaml_registry, component_registry)
+    save_registry_cache(cache)
 
     if success:
         lesson_count = sum(1 for e in entities if e.get("entityType") == "lesson")
@@ -0,0 +1,118 @@
+"""Tests for registry_builder.py.
+
+Run from the repository root with: python3 -m unittest discover dev/py
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import registry_builder  # noqa: E402
+
+HEADER = """import { z } from 'zod';
+
+export const BasicTaskComponentConfigSchema = z.object({
+  type: z.literal('basic_task'),
+});
+
+export const BasicTaskComponentProgressSchema = z.object({});
+
+export class BasicTaskProgressManager extends BaseComponentProgressManager<Config, Progress> {
+}
+
+export function createInitialProgress(config: Config): Progress {
+  return {};
+}
+"""
+
+VALIDATOR = """
+export function validateBasicTaskStructure(progress: Progress): Progress {
+  return progress;
+}
+"""
+
+# Enough filler to push anything after it past the bounded first read
+PADDING = "// filler line to grow the component file\n" * (
+    registry_builder.SCAN_READ_CHARS // 40 + 1
+)
+
+
+class ScanComponentFileTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def write_core(self, content: str) -> Path:
+        path = Path(self.tmpdir.name) / "basicTaskCore.ts"
+        path.write_text(content, encoding="utf-8")
+        return path
+
+    def test_small_file_finds_all_fields(self):
+        info = registry_builder.scan_component_file(self.write_core(HEADER + VALIDATOR))
+
+        self.assertEqual(info["typeName"], "basic_task")
+        self.assertEqual(info["validatorFunction"], "validateBasicTaskStructure")
+
+    def test_oversized_file_finds_validator_past_first_read(self):
+        path = self.write_core(HEADER + PADDING + VALIDATOR)
+        self.assertGreater(path.stat().st_size, registry_builder.SCAN_READ_CHARS)
+
+        info = registry_builder.scan_component_file(path)
+
+        self.assertEqual(info["componentClass"], "BasicTaskProgressManager")
+        self.assertEqual(info["validatorFunction"], "validateBasicTaskStructure")
+
+    def test_oversized_file_without_validator_still_registers(self):
+        info = registry_builder.scan_component_file(self.write_core(HEADER + PADDING))
+
+        self.assertEqual(info["typeName"], "basic_task")
+        self.assertNotIn("validatorFunction", info)
+
+
+class ParseEntityYamlTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        # Entity paths are recorded relative to the working directory
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.tmpdir.name)
+
+    def write_lesson(self, components: str) -> Path:
+        path = Path("lesson.yaml")
+        path.write_text(
+            "metadata:\n"
+            "  id: 12345\n"
+            "  title: Test Lesson\n"
+            "  domainId: 1001\n"
+            "pages:\n"
+            "  - components:\n" + components,
+            encoding="utf-8",
+        )
+        return path
+
+    def test_collects_component_pairs(self):
+        path = self.write_lesson(
+            "      - id: 1\n"
+            "        type: basic_task\n"
+            "      - id: 2\n"
+        )
+
+        entity_info, components = registry_builder.parse_entity_yaml(path, "lesson")
+
+        self.assertEqual(entity_info["componentCount"], 2)
+        self.assertEqual(entity_info["domainId"], 1001)
+        self.assertEqual(components, [[1, "basic_task"]])
+
+    def test_malformed_component_fails_the_build(self):
+        path = self.write_lesson("      - just-a-string\n")
+
+        with self.assertRaises(AttributeError):
+            registry_builder.parse_entity_yaml(path, "lesson")
+
+
+if __name__ == "__main__":
+    unittest.main()
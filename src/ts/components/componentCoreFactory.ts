@@ -28,7 +28,6 @@ import type { MainMenuComponentConfig } from "./cores/mainMenuCore.js";
 import type { MainMenuProgressManager } from "./cores/mainMenuCore.js";
 import { SettingsMenuCore } from "./cores/settingsMenuCore.js";
 import type { SettingsMenuComponentConfig } from "./cores/settingsMenuCore.js";
-import type { SettingsMenuProgressManager } from "./cores/settingsMenuCore.js";
 
 /**
  * Create a component Core instance based on type string.
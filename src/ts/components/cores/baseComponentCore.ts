@@ -24,13 +24,11 @@ import { TimelineContainer } from "../../ui/timelineContainer.js";
 import { BaseComponentInterface } from "../interfaces/baseComponentInterface.js";
 import {
   IReadonlyOverallProgressManager,
-  OverallProgressData,
   OverallProgressMessage,
   OverallProgressMessageQueueManager,
 } from "../../core/overallProgressSchema.js";
 
 import {
-  NavigationState,
   NavigationMessage,
   NavigationMessageQueueManager,
   IReadonlyNavigationManager,
@@ -38,7 +36,6 @@ import {
 
 import {
   IReadonlySettingsManager,
-  SettingsData,
   SettingsMessage,
   SettingsMessageQueueManager,
 } from "../../core/settingsSchema.js";
@@ -0,0 +1,116 @@
+/**
+ * @fileoverview Test Suite for Basic Task Core
+ * @module components/cores/basicTaskCore.test
+ *
+ * Tests completion status derived from checkbox progress:
+ * - Required checkboxes gate completion
+ * - Optional checkboxes never affect completion
+ * - Progress arrays shorter than the config read as unchecked
+ */
+
+import { describe, it, expect, vi } from 'vitest';
+import type { TimelineContainer } from '../../ui/timelineContainer.js';
+
+// ============================================================================
+// MOCK TIMELINE CONTAINER
+// ============================================================================
+// The core only passes the timeline through to createInterface(), which the
+// test subclass overrides. Mock it to avoid DOM dependency in unit tests.
+vi.mock('../../ui/timelineContainer.js', () => ({
+  getTimelineInstance: vi.fn(),
+}));
+
+// Import after mocks are set up
+import {
+  BasicTaskCore,
+  BasicTaskProgressManager,
+  type BasicTaskComponentConfig,
+  type BasicTaskComponentProgress,
+} from './basicTaskCore.js';
+
+// ============================================================================
+// HELPERS
+// ============================================================================
+
+/**
+ * BasicTaskInterface is not implemented yet, so the real createInterface()
+ * throws. Stub it out so the core can be constructed.
+ */
+class TestBasicTaskCore extends BasicTaskCore {
+  protected createInterface(_timeline: TimelineContainer): any {
+    return {};
+  }
+}
+
+function createConfig(required: boolean[]): BasicTaskComponentConfig {
+  return {
+    id: 100,
+    type: 'basic_task',
+    accessibility_label: 'Test task',
+    order: 100,
+    title: 'Test Task',
+    description: 'Check off the items',
+    checkboxes: required.map((isRequired, i) => ({
+      content: `Item ${i}`,
+      required: isRequired,
+    })),
+  };
+}
+
+function createCore(
+  required: boolean[],
+  checked: boolean[]
+): BasicTaskCore {
+  const config = createConfig(required);
+  const progress: BasicTaskComponentProgress = {
+    checkbox_checked: checked,
+    lastUpdated: 0,
+  };
+
+  return new TestBasicTaskCore(
+    config,
+    new BasicTaskProgressManager(config, progress),
+    {} as TimelineContainer,
+    {} as any,
+    {} as any,
+    {} as any,
+    {} as any
+  );
+}
+
+// ============================================================================
+// COMPLETION STATUS
+// ============================================================================
+
+describe('BasicTaskCore.isComplete', () => {
+  it('should be complete when all required boxes are checked', () => {
+    const core = createCore([true, true, true], [true, true, true]);
+
+    expect(core.isComplete()).toBe(true);
+  });
+
+  it('should be complete when only an optional box is left unchecked', () => {
+    const core = createCore([true, false, true], [true, false, true]);
+
+    expect(core.isComplete()).toBe(true);
+  });
+
+  it('should not be complete when a required box is unchecked', () => {
+    const core = createCore([true, false, true], [true, true, false]);
+
+    expect(core.isComplete()).toBe(false);
+  });
+
+  it('should not be complete when progress is shorter than the config', () => {
+    // Required index 2 has no progress entry at all
+    const core = createCore([true, false, true], [true, true]);
+
+    expect(core.isComplete()).toBe(false);
+  });
+
+  it('should be complete when the missing entries are all optional', () => {
+    const core = createCore([true, false, false], [true]);
+
+    expect(core.isComplete()).toBe(true);
+  });
+});
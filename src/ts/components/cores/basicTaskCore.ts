@@ -294,6 +294,7 @@ export class BasicTaskCore extends BaseComponentCore<
   BasicTaskComponentProgress
 > {
   private _componentProgressQueueManager: BasicTaskMessageQueueManager;
+  private _requiredCheckboxIndices: readonly number[];
 
   constructor(
     config: BasicTaskComponentConfig,
@@ -318,6 +319,11 @@ export class BasicTaskCore extends BaseComponentCore<
     this._componentProgressQueueManager = new BasicTaskMessageQueueManager(
       config.id
     );
+
+    // Config is immutable, so required checkbox positions are computed once
+    this._requiredCheckboxIndices = config.checkboxes.flatMap((checkbox, i) =>
+      checkbox.required ? [i] : []
+    );
   }
 
   /**
@@ -354,20 +360,10 @@ export class BasicTaskCore extends BaseComponentCore<
    * Optional checkboxes don't affect completion status.
    */
   isComplete(): boolean {
-    const progress = this._progressManager.getProgress();
-
-    for (let i = 0; i < this._config.checkboxes.length; i++) {
-      const checkbox = this._config.checkboxes[i];
-      if (checkbox.required) {
-        if (
-          i >= progress.checkbox_checked.length ||
-          !progress.checkbox_checked[i]
-        ) {
-          return false;
-        }
-      }
-    }
-    return true;
+    const checked = this._progressManager.getProgress().checkbox_checked;
+
+    // Only required indices are visited; out-of-range reads as unchecked
+    return this._requiredCheckboxIndices.every((i) => checked[i] === true);
   }
 
   /**
@@ -34,7 +34,7 @@ import {
   NavigationMessageQueueManager,
   type NavigationMessage,
 } from "../../core/navigationSchema.js";
-import { domainData, lessonMetadata } from "../../registry/mera-registry.js";
+import { domainDataMap, lessonMetadata } from "../../registry/mera-registry.js";
 
 // ============================================================================
 // SCHEMAS
@@ -441,7 +441,7 @@ export class MainMenuCore extends BaseComponentCore<
     const domainIds = this._curriculumRegistry.getAllDomainIds();
 
     return domainIds.map((domainId) => {
-      const metadata = domainData.find((d: any) => d.id === domainId);
+      const metadata = domainDataMap.get(domainId);
 
       // Cast to access getDomainProgress() which isn't on readonly interface
       const progress = (this._overallProgressManager as any).getDomainProgress(
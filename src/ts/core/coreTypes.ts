@@ -1,7 +1,6 @@
 // coreTypes.ts - Shared core types and schemas
 
 import { z } from "zod";
-import { OverallProgressDataSchema } from "./overallProgressSchema.js";
 
 /**
  * IMMUTABLE ID ALLOCATION SCHEME
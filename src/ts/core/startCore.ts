@@ -53,7 +53,6 @@ import { createComponentProgressHandlers } from "../components/componentProgress
 import { componentIdToTypeMap } from "../registry/mera-registry.js";
 import { componentToLessonMap } from "../registry/mera-registry.js";
 import { runCore } from "./runCore.js";
-import { PodMetadata } from '../persistence/podStorageSchema';
 
 /**
  * Initialize and start the main application core.
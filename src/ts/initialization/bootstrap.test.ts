@@ -166,12 +166,12 @@ describe('bootstrap', () => {
       expect(initializationOrchestrator).toHaveBeenCalled();
     });
 
-    it('should timeout after 50 attempts with no connection', async () => {
+    it('should time out after the 5s deadline with no connection', async () => {
       mockBridge.check.mockReturnValue(false);
 
       const promise = startBootstrap();
       
-      // Advance past timeout (50 attempts × 100ms = 5000ms)
+      // Advance to the 5000ms deadline (10→100ms backoff, last wait clamped)
       await vi.advanceTimersByTimeAsync(5000);
       await promise;
 
@@ -179,6 +179,52 @@ describe('bootstrap', () => {
       expect(mockErrorDisplay.showConnectionError).toHaveBeenCalledWith('solid');
       expect(initializationOrchestrator).not.toHaveBeenCalled();
     });
+
+    it('should not give up before the 5s deadline', async () => {
+      mockBridge.check.mockReturnValue(false);
+
+      const promise = startBootstrap();
+
+      await vi.advanceTimersByTimeAsync(4999);
+      expect(mockErrorDisplay.showConnectionError).not.toHaveBeenCalled();
+
+      await vi.advanceTimersByTimeAsync(1);
+      await promise;
+
+      expect(mockErrorDisplay.showConnectionError).toHaveBeenCalledWith('solid');
+    });
+
+    it('should clamp the last wait to the deadline', async () => {
+      const start = Date.now();
+      const checkTimes: number[] = [];
+      mockBridge.check.mockImplementation(() => {
+        checkTimes.push(Date.now() - start);
+        return false;
+      });
+
+      const promise = startBootstrap();
+      await vi.advanceTimersByTimeAsync(5000);
+      await promise;
+
+      // Backoff: checks at 0, 10, 30, 70, 150, then every 100ms
+      expect(checkTimes.slice(0, 6)).toEqual([0, 10, 30, 70, 150, 250]);
+      // Last check lands exactly on the deadline, after a shortened 50ms wait
+      expect(checkTimes[checkTimes.length - 1]).toBe(5000);
+      expect(checkTimes[checkTimes.length - 2]).toBe(4950);
+    });
+
+    it('should detect a fast session restore within ~10ms', async () => {
+      const start = Date.now();
+      // Session restore completes 5ms after bootstrap starts
+      mockBridge.check.mockImplementation(() => Date.now() - start >= 5);
+
+      const promise = startBootstrap();
+      await vi.advanceTimersByTimeAsync(10);
+      await promise;
+
+      expect(mockBridge.check).toHaveBeenCalledTimes(2);
+      expect(initializationOrchestrator).toHaveBeenCalled();
+    });
   });
 
   // ============================================================================
@@ -414,5 +460,37 @@ describe('bootstrap', () => {
       // Should call showConnectionError with 'solid' parameter
       expect(mockErrorDisplay.showConnectionError).toHaveBeenCalledWith('solid');
     });
+
+    it('should report only the auth error when unauthenticated and the clock check rejects', async () => {
+      mockBridge.check.mockReturnValue(false);
+      vi.mocked(global.fetch).mockRejectedValue(new Error('Network error'));
+
+      const promise = startBootstrap();
+      await vi.advanceTimersByTimeAsync(5000);
+      await promise;
+
+      // Clock check starts before polling, but its failure must stay silent
+      expect(global.fetch).toHaveBeenCalled();
+      expect(mockErrorDisplay.showConnectionError).toHaveBeenCalledWith('solid');
+      expect(mockErrorDisplay.showSystemError).not.toHaveBeenCalled();
+    });
+
+    it('should report only the auth error when unauthenticated and the clock is skewed', async () => {
+      mockBridge.check.mockReturnValue(false);
+      vi.mocked(global.fetch).mockResolvedValue({
+        ok: true,
+        headers: new Headers({ 
+          'Date': new Date(Date.now() - 120000).toUTCString()
+        }),
+      } as Response);
+
+      const promise = startBootstrap();
+      await vi.advanceTimersByTimeAsync(5000);
+      await promise;
+
+      expect(global.fetch).toHaveBeenCalled();
+      expect(mockErrorDisplay.showConnectionError).toHaveBeenCalledWith('solid');
+      expect(mockErrorDisplay.showSystemError).not.toHaveBeenCalled();
+    });
   });
 });
\ No newline at end of file
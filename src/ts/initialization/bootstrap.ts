@@ -28,14 +28,20 @@ import { initializeTimeline } from '../ui/timelineContainer.js';
 const CLOCK_SKEW_THRESHOLD_MS = 60_000;
 
 /**
- * Maximum number of polling attempts for Solid authentication (50 × 100ms = 5s).
+ * How long to wait for Solid authentication before giving up (5s).
  */
-const MAX_ATTEMPTS = 50;
+const AUTH_TIMEOUT_MS = 5_000;
 
 /**
- * Interval between Solid authentication checks (milliseconds).
+ * First delay between Solid authentication checks (milliseconds).
+ * Doubles after each miss so a fast session restore is noticed quickly.
  */
-const POLL_INTERVAL_MS = 100;
+const INITIAL_POLL_INTERVAL_MS = 10;
+
+/**
+ * Upper bound on the delay between Solid authentication checks (milliseconds).
+ */
+const MAX_POLL_INTERVAL_MS = 100;
 
 // ============================================================================
 // Module-Level State
@@ -51,6 +57,12 @@ let timeline: TimelineContainer | null = null;
  */
 let errorDisplay: SolidConnectionErrorDisplay | null = null;
 
+/**
+ * Auth-status loading element, looked up once during UI setup and reused
+ * by the bootstrap error fallback.
+ */
+let authStatusElement: HTMLElement | null = null;
+
 // ============================================================================
 // Setup & Error Handling
 // ============================================================================
@@ -68,9 +80,9 @@ function setupUI(): boolean {
     console.log("🎨 Setting up UI components...");
 
     // Hide auth-status loading screen
-    const authStatus = document.getElementById("auth-status");
-    if (authStatus) {
-      authStatus.classList.add("hidden");
+    authStatusElement = document.getElementById("auth-status");
+    if (authStatusElement) {
+      authStatusElement.classList.add("hidden");
     }
 
     // HIDE THE HEADER STATUS
@@ -119,7 +131,8 @@ function showBootstrapError(error: Error | unknown): void {
   }
 
   // Simple fallback if error display isn't ready yet
-  const authStatus = document.getElementById("auth-status");
+  const authStatus =
+    authStatusElement ?? document.getElementById("auth-status");
   if (authStatus) {
     authStatus.innerHTML = `
       <div class="text-center py-12">
@@ -187,6 +200,38 @@ async function checkClockSkew(): Promise<void> {
   }
 }
 
+/**
+ * Poll for Solid authentication until connected or AUTH_TIMEOUT_MS elapses.
+ * 
+ * The delay between checks starts at INITIAL_POLL_INTERVAL_MS and doubles up
+ * to MAX_POLL_INTERVAL_MS; the final wait is clamped to the deadline.
+ * 
+ * @param bridge - Bridge used for the lightweight connection check
+ * @returns true once connected, false if the deadline passes first
+ */
+async function waitForSolidConnection(bridge: MeraBridge): Promise<boolean> {
+  const deadline = Date.now() + AUTH_TIMEOUT_MS;
+  let delay = INITIAL_POLL_INTERVAL_MS;
+  for (let attempt = 1; ; attempt++) {
+    // Lightweight check - doesn't trigger initialization
+    if (bridge.check()) {
+      console.log(`✅ Solid Pod connected (attempt ${attempt})`);
+      return true;
+    }
+
+    const remaining = deadline - Date.now();
+    if (remaining <= 0) {
+      return false;
+    }
+
+    // Not connected yet, wait and retry
+    await new Promise((resolve) =>
+      setTimeout(resolve, Math.min(delay, remaining))
+    );
+    delay = Math.min(delay * 2, MAX_POLL_INTERVAL_MS);
+  }
+}
+
 // ============================================================================
 // Flow Control Functions
 // ============================================================================
@@ -245,7 +290,8 @@ function noSolidConnection(): void {
  * 
  * Execution sequence:
  * 1. Setup UI components
- * 2. Poll for Solid Pod authentication (up to 5 seconds)
+ * 2. Poll for Solid Pod authentication (up to 5 seconds), with the clock
+ *    check request already in flight
  * 3. Verify client clock is synchronized with server
  * 4. Fire off initializationOrchestrator and exit
  * 5. Show authentication error if Solid unavailable
@@ -268,27 +314,24 @@ async function startBootstrap(): Promise<void> {
 
     const bridge = MeraBridge.getInstance();
 
-    // Poll for Solid authentication with timeout
-    for (let attempt = 1; attempt <= MAX_ATTEMPTS; attempt++) {
-      // Lightweight check - doesn't trigger initialization
-      if (bridge.check()) {
-        console.log(`✅ Solid Pod connected (attempt ${attempt})`);
+    // Clock check doesn't depend on authentication - start its request now
+    // so it overlaps the polling below instead of running after it
+    const clockCheck = checkClockSkew();
+    // Only awaited once connected; keep a timeout path from leaving it unhandled
+    clockCheck.catch(() => {});
 
-        // Verify clock before proceeding
-        await checkClockSkew();
+    if (await waitForSolidConnection(bridge)) {
+      // Verify clock before proceeding
+      await clockCheck;
 
-        // Continue to initialization
-        continueToNextModule();
-        return;
-      }
-
-      // Not connected yet, wait and retry
-      await new Promise((resolve) => setTimeout(resolve, POLL_INTERVAL_MS));
+      // Continue to initialization
+      continueToNextModule();
+      return;
     }
 
-    // Timeout - no Solid connection after MAX_ATTEMPTS
+    // Timeout - no Solid connection within AUTH_TIMEOUT_MS
     console.log(
-      `❌ No Solid Pod connection after ${MAX_ATTEMPTS} attempts. Authentication required.`
+      `❌ No Solid Pod connection after ${AUTH_TIMEOUT_MS}ms. Authentication required.`
     );
     noSolidConnection();
   } catch (error) {
@@ -47,7 +47,6 @@ import {
 } from "../core/overallProgressSchema.js";
 import {
   SettingsData,
-  SettingsDataSchema,
   getDefaultSettings,
 } from "../core/settingsSchema.js";
 import {
@@ -58,10 +57,8 @@ import {
 } from "../core/navigationSchema.js";
 import {
   CombinedComponentProgress,
-  CombinedComponentProgressSchema,
 } from "../core/combinedComponentProgressSchema.js";
 import {
-  CurriculumRegistry,
   progressSchemaMap,
   componentValidatorMap,
   componentInitializerMap,
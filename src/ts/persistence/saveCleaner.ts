@@ -12,7 +12,6 @@
  */
 
 import { MeraBridge } from "../solid/meraBridge.js";
-import { showCriticalError } from "../ui/errorDisplay.js";
 
 /**
  * Represents a timestamped backup file with age calculation.
@@ -17,9 +17,6 @@
  * corruption immediately rather than discovering it later during recovery.
  */
 
-import {
-  PodStorageBundleSchema,
-} from "./podStorageSchema.js";
 import { SaveResult } from "./saveManager.js";
 import { CURRENT_SCHEMA_VERSION } from "./schemaVersion.js";
 import { MeraBridge } from "../solid/meraBridge.js";
@@ -1,6 +1,6 @@
 /*
  * Auto-generated Complete Registry for TypeScript Bundling
- * Generated on: 2026-02-03T21:03:10.510027
+ * Content hash: dc7eabce15ad1313
  * 
  * This file contains ALL 12 mappings and parsed YAML data.
  * Gets bundled into mera-app.js via TypeScript compilation.
@@ -10,14 +10,17 @@
  */
 
 import { 
-    NewUserWelcomeProgressManager, NewUserWelcomeComponentConfigSchema, NewUserWelcomeComponentProgressSchema, createInitialProgress as createInitialNewUserWelcomeProgress
-} from '../components/cores/newUserWelcomeCore.js';
+    BasicTaskProgressManager, BasicTaskComponentConfigSchema, BasicTaskComponentProgressSchema, validateBasicTaskStructure, createInitialProgress as createInitialBasicTaskProgress
+} from '../components/cores/basicTaskCore.js';
 import { 
     MainMenuProgressManager, MainMenuComponentConfigSchema, MainMenuComponentProgressSchema, createInitialProgress as createInitialMainMenuProgress
 } from '../components/cores/mainMenuCore.js';
 import { 
-    BasicTaskProgressManager, BasicTaskComponentConfigSchema, BasicTaskComponentProgressSchema, validateBasicTaskStructure, createInitialProgress as createInitialBasicTaskProgress
-} from '../components/cores/basicTaskCore.js';
+    MultipleChoiceQuestionProgressManager, MultipleChoiceQuestionComponentConfigSchema, MultipleChoiceQuestionComponentProgressSchema, validateMultipleChoiceQuestionStructure, createInitialProgress as createInitialMultipleChoiceQuestionProgress
+} from '../components/cores/multipleChoiceQuestionsCore.js';
+import { 
+    NewUserWelcomeProgressManager, NewUserWelcomeComponentConfigSchema, NewUserWelcomeComponentProgressSchema, createInitialProgress as createInitialNewUserWelcomeProgress
+} from '../components/cores/newUserWelcomeCore.js';
 import { 
     SettingsMenuProgressManager, SettingsMenuComponentConfigSchema, SettingsMenuComponentProgressSchema, createInitialProgress as createInitialSettingsMenuProgress
 } from '../components/cores/settingsMenuCore.js';
@@ -26,9 +29,10 @@ import {
  * MAPPING 1: Component Type to Class
  */
 export const componentTypeMap = new Map<string, any>([
-    ["new_user_welcome", NewUserWelcomeProgressManager],
-    ["main_menu", MainMenuProgressManager],
     ["basic_task", BasicTaskProgressManager],
+    ["main_menu", MainMenuProgressManager],
+    ["multiple_choice_question", MultipleChoiceQuestionProgressManager],
+    ["new_user_welcome", NewUserWelcomeProgressManager],
     ["settings_menu", SettingsMenuProgressManager]
 ]);
 
@@ -36,9 +40,10 @@ export const componentTypeMap = new Map<string, any>([
  * MAPPING 2: Component Type to Config Schema
  */
 export const configSchemaMap = new Map<string, any>([
-    ["new_user_welcome", NewUserWelcomeComponentConfigSchema],
-    ["main_menu", MainMenuComponentConfigSchema],
     ["basic_task", BasicTaskComponentConfigSchema],
+    ["main_menu", MainMenuComponentConfigSchema],
+    ["multiple_choice_question", MultipleChoiceQuestionComponentConfigSchema],
+    ["new_user_welcome", NewUserWelcomeComponentConfigSchema],
     ["settings_menu", SettingsMenuComponentConfigSchema]
 ]);
 
@@ -46,9 +51,10 @@ export const configSchemaMap = new Map<string, any>([
  * MAPPING 3: Component Type to Progress Schema
  */
 export const progressSchemaMap = new Map<string, any>([
-    ["new_user_welcome", NewUserWelcomeComponentProgressSchema],
-    ["main_menu", MainMenuComponentProgressSchema],
     ["basic_task", BasicTaskComponentProgressSchema],
+    ["main_menu", MainMenuComponentProgressSchema],
+    ["multiple_choice_question", MultipleChoiceQuestionComponentProgressSchema],
+    ["new_user_welcome", NewUserWelcomeComponentProgressSchema],
     ["settings_menu", SettingsMenuComponentProgressSchema]
 ]);
 
@@ -56,16 +62,18 @@ export const progressSchemaMap = new Map<string, any>([
  * MAPPING 4: Component Type to Validator Function
  */
 export const componentValidatorMap = new Map<string, Function>([
-    ["basic_task", validateBasicTaskStructure]
+    ["basic_task", validateBasicTaskStructure],
+    ["multiple_choice_question", validateMultipleChoiceQuestionStructure]
 ]);
 
 /**
  * MAPPING 5: Component Type to Initializer Function
  */
 export const componentInitializerMap = new Map<string, Function>([
-    ["new_user_welcome", createInitialNewUserWelcomeProgress],
-    ["main_menu", createInitialMainMenuProgress],
     ["basic_task", createInitialBasicTaskProgress],
+    ["main_menu", createInitialMainMenuProgress],
+    ["multiple_choice_question", createInitialMultipleChoiceQuestionProgress],
+    ["new_user_welcome", createInitialNewUserWelcomeProgress],
     ["settings_menu", createInitialSettingsMenuProgress]
 ]);
 
@@ -75,10 +83,10 @@ export const componentInitializerMap = new Map<string, Function>([
  */
 export const componentRegistrations = [
     {
-        componentClass: NewUserWelcomeProgressManager,
-        configSchema: NewUserWelcomeComponentConfigSchema,
-        progressSchema: NewUserWelcomeComponentProgressSchema,
-        typeName: 'new_user_welcome'
+        componentClass: BasicTaskProgressManager,
+        configSchema: BasicTaskComponentConfigSchema,
+        progressSchema: BasicTaskComponentProgressSchema,
+        typeName: 'basic_task'
     },
     {
         componentClass: MainMenuProgressManager,
@@ -87,10 +95,16 @@ export const componentRegistrations = [
         typeName: 'main_menu'
     },
     {
-        componentClass: BasicTaskProgressManager,
-        configSchema: BasicTaskComponentConfigSchema,
-        progressSchema: BasicTaskComponentProgressSchema,
-        typeName: 'basic_task'
+        componentClass: MultipleChoiceQuestionProgressManager,
+        configSchema: MultipleChoiceQuestionComponentConfigSchema,
+        progressSchema: MultipleChoiceQuestionComponentProgressSchema,
+        typeName: 'multiple_choice_question'
+    },
+    {
+        componentClass: NewUserWelcomeProgressManager,
+        configSchema: NewUserWelcomeComponentConfigSchema,
+        progressSchema: NewUserWelcomeComponentProgressSchema,
+        typeName: 'new_user_welcome'
     },
     {
         componentClass: SettingsMenuProgressManager,
@@ -125,13 +139,13 @@ export interface LessonMetrics {
  * Maps lesson ID to page count and component count
  */
 export const lessonMetrics = new Map<number, LessonMetrics>([
-    [12348, { pageCount: 2, componentCount: 2, title: "Phishing Recognition Basics", difficulty: "beginner" }],
     [0, { pageCount: 1, componentCount: 1, title: "Main Menu", difficulty: "beginner" }],
+    [12346, { pageCount: 2, componentCount: 2, title: "Phishing Recognition Basics", difficulty: "beginner" }],
+    [12347, { pageCount: 2, componentCount: 2, title: "Phishing Recognition Basics", difficulty: "beginner" }],
+    [12348, { pageCount: 2, componentCount: 2, title: "Phishing Recognition Basics", difficulty: "beginner" }],
     [12345, { pageCount: 2, componentCount: 2, title: "Phishing Recognition Basics", difficulty: "beginner" }],
-    [1, { pageCount: 1, componentCount: 1, title: "Welcome to Mera", difficulty: "beginner" }],
     [2, { pageCount: 1, componentCount: 1, title: "Settings", difficulty: "beginner" }],
-    [12346, { pageCount: 2, componentCount: 2, title: "Phishing Recognition Basics", difficulty: "beginner" }],
-    [12347, { pageCount: 2, componentCount: 2, title: "Phishing Recognition Basics", difficulty: "beginner" }]
+    [1, { pageCount: 1, componentCount: 1, title: "Welcome to Mera", difficulty: "beginner" }]
 ]);
 
 /**
@@ -177,9 +191,9 @@ export const componentToLessonMap = new Map<number, number>([
  * Maps domain ID to array of lesson IDs in that domain
  */
 export const domainLessonMap = new Map<number, number[]>([
-    [1003, [12347]],
-    [1002, [12346]],
     [1001, [12345]],
+    [1002, [12346]],
+    [1003, [12347]],
     [1004, [12348]]
 ]);
 
@@ -271,163 +285,20 @@ export const curriculumData = new CurriculumRegistry(
  * MAPPING 11: Domain Data
  * Array of all domain definitions
  */
-export const domainData = [
-  {
-    "id": 1003,
-    "title": "Communicate Securely",
-    "description": "Protect your conversations from surveillance and interception",
-    "pedagogical_focus": "Secure communication tools and practices for activist organizing",
-    "lesson_count": 20,
-    "estimated_weeks": 7,
-    "order": 3,
-    "key_outcomes": [
-      "Use Signal for sensitive communications",
-      "Verify safety numbers with key contacts",
-      "Understand metadata risks in messaging",
-      "Share files securely without corporate surveillance"
-    ],
-    "core_concept": "End-to-end encryption - protect message content and minimize metadata exposure"
-  },
-  {
-    "id": 1002,
-    "title": "Lock Down Your Accounts",
-    "description": "Secure existing accounts with strong passwords, 2FA, and proper device settings",
-    "pedagogical_focus": "Basic account security and device hardening for everyday protection",
-    "lesson_count": 20,
-    "estimated_weeks": 7,
-    "order": 2,
-    "key_outcomes": [
-      "Implement strong unique passwords with password manager",
-      "Enable two-factor authentication on critical accounts",
-      "Configure secure device settings (disable FaceID, auto-backup)",
-      "Understand and manage app permissions"
-    ],
-    "core_concept": "Defense in depth - multiple layers of security on devices and accounts"
-  },
-  {
-    "id": 1001,
-    "title": "Separate Your Identities",
-    "description": "Learn to compartmentalize your digital life between activist and civilian identities",
-    "pedagogical_focus": "Identity separation and account isolation to protect activist work from surveillance",
-    "lesson_count": 20,
-    "estimated_weeks": 7,
-    "order": 1,
-    "key_outcomes": [
-      "Create separate activist and civilian email accounts",
-      "Migrate sensitive accounts to protected identity",
-      "Understand metadata risks in social media",
-      "Maintain boundaries between identities"
-    ],
-    "core_concept": "Compartmentalization - assume civilian identity is compromised, protect activist identity"
-  },
-  {
-    "id": 1004,
-    "title": "Recognize & Respond to Threats",
-    "description": "Identify phishing, social engineering, and surveillance, then respond appropriately",
-    "pedagogical_focus": "Threat recognition and incident response for activist contexts",
-    "lesson_count": 18,
-    "estimated_weeks": 6,
-    "order": 4,
-    "key_outcomes": [
-      "Recognize phishing attempts and social engineering",
-      "Identify surveillance indicators",
-      "Respond appropriately to device seizure",
-      "Implement threat-appropriate security measures"
-    ],
-    "core_concept": "Threat modeling - recognize attacks and respond proportionally to actual risk"
-  }
-];
+export const domainData = [{"id":1001,"title":"Separate Your Identities","description":"Learn to compartmentalize your digital life between activist and civilian identities","pedagogical_focus":"Identity separation and account isolation to protect activist work from surveillance","lesson_count":20,"estimated_weeks":7,"order":1,"key_outcomes":["Create separate activist and civilian email accounts","Migrate sensitive accounts to protected identity","Understand metadata risks in social media","Maintain boundaries between identities"],"core_concept":"Compartmentalization - assume civilian identity is compromised, protect activist identity"},{"id":1002,"title":"Lock Down Your Accounts","description":"Secure existing accounts with strong passwords, 2FA, and proper device settings","pedagogical_focus":"Basic account security and device hardening for everyday protection","lesson_count":20,"estimated_weeks":7,"order":2,"key_outcomes":["Implement strong unique passwords with password manager","Enable two-factor authentication on critical accounts","Configure secure device settings (disable FaceID, auto-backup)","Understand and manage app permissions"],"core_concept":"Defense in depth - multiple layers of security on devices and accounts"},{"id":1003,"title":"Communicate Securely","description":"Protect your conversations from surveillance and interception","pedagogical_focus":"Secure communication tools and practices for activist organizing","lesson_count":20,"estimated_weeks":7,"order":3,"key_outcomes":["Use Signal for sensitive communications","Verify safety numbers with key contacts","Understand metadata risks in messaging","Share files securely without corporate surveillance"],"core_concept":"End-to-end encryption - protect message content and minimize metadata exposure"},{"id":1004,"title":"Recognize & Respond to Threats","description":"Identify phishing, social engineering, and surveillance, then respond appropriately","pedagogical_focus":"Threat recognition and incident response for activist contexts","lesson_count":18,"estimated_weeks":6,"order":4,"key_outcomes":["Recognize phishing attempts and social engineering","Identify surveillance indicators","Respond appropriately to device seizure","Implement threat-appropriate security measures"],"core_concept":"Threat modeling - recognize attacks and respond proportionally to actual risk"}];
+
+/**
+ * Domain definitions keyed by domain ID (same objects as domainData)
+ */
+export const domainDataMap = new Map<number, any>(
+  domainData.map((domain: any) => [domain.id, domain])
+);
 
 /**
  * MAPPING 12: Entity Metadata
  * Complete metadata for all entities (lessons and menus)
  */
-export const lessonMetadata = [
-  {
-    "id": 12348,
-    "path": "static/yaml/lessons/phishing-basics-4.yaml",
-    "title": "Phishing Recognition Basics",
-    "entityType": "lesson",
-    "pageCount": 2,
-    "componentCount": 2,
-    "difficulty": "beginner",
-    "estimatedMinutes": 8,
-    "required": true,
-    "domainId": 1004
-  },
-  {
-    "id": 0,
-    "path": "static/yaml/lessons/main_menu.yaml",
-    "title": "Main Menu",
-    "entityType": "lesson",
-    "pageCount": 1,
-    "componentCount": 1,
-    "difficulty": "beginner",
-    "estimatedMinutes": 1,
-    "required": true,
-    "domainId": null
-  },
-  {
-    "id": 12345,
-    "path": "static/yaml/lessons/phishing-basics.yaml",
-    "title": "Phishing Recognition Basics",
-    "entityType": "lesson",
-    "pageCount": 2,
-    "componentCount": 2,
-    "difficulty": "beginner",
-    "estimatedMinutes": 8,
-    "required": true,
-    "domainId": 1001
-  },
-  {
-    "id": 1,
-    "path": "static/yaml/lessons/welcome_menu.yaml",
-    "title": "Welcome to Mera",
-    "entityType": "lesson",
-    "pageCount": 1,
-    "componentCount": 1,
-    "difficulty": "beginner",
-    "estimatedMinutes": 5,
-    "required": true,
-    "domainId": null
-  },
-  {
-    "id": 2,
-    "path": "static/yaml/lessons/settings_menu.yaml",
-    "title": "Settings",
-    "entityType": "lesson",
-    "pageCount": 1,
-    "componentCount": 1,
-    "difficulty": "beginner",
-    "estimatedMinutes": 2,
-    "required": true,
-    "domainId": null
-  },
-  {
-    "id": 12346,
-    "path": "static/yaml/lessons/phishing-basics-2.yaml",
-    "title": "Phishing Recognition Basics",
-    "entityType": "lesson",
-    "pageCount": 2,
-    "componentCount": 2,
-    "difficulty": "beginner",
-    "estimatedMinutes": 8,
-    "required": true,
-    "domainId": 1002
-  },
-  {
-    "id": 12347,
-    "path": "static/yaml/lessons/phishing-basics-3.yaml",
-    "title": "Phishing Recognition Basics",
-    "entityType": "lesson",
-    "pageCount": 2,
-    "componentCount": 2,
-    "difficulty": "beginner",
-    "estimatedMinutes": 8,
-    "required": true,
-    "domainId": 1003
-  }
-];
+export const lessonMetadata = [{"id":0,"path":"static/yaml/lessons/main_menu.yaml","title":"Main Menu","entityType":"lesson","pageCount":1,"componentCount":1,"difficulty":"beginner","estimatedMinutes":1,"required":true,"domainId":null},{"id":12346,"path":"static/yaml/lessons/phishing-basics-2.yaml","title":"Phishing Recognition Basics","entityType":"lesson","pageCount":2,"componentCount":2,"difficulty":"beginner","estimatedMinutes":8,"required":true,"domainId":1002},{"id":12347,"path":"static/yaml/lessons/phishing-basics-3.yaml","title":"Phishing Recognition Basics","entityType":"lesson","pageCount":2,"componentCount":2,"difficulty":"beginner","estimatedMinutes":8,"required":true,"domainId":1003},{"id":12348,"path":"static/yaml/lessons/phishing-basics-4.yaml","title":"Phishing Recognition Basics","entityType":"lesson","pageCount":2,"componentCount":2,"difficulty":"beginner","estimatedMinutes":8,"required":true,"domainId":1004},{"id":12345,"path":"static/yaml/lessons/phishing-basics.yaml","title":"Phishing Recognition Basics","entityType":"lesson","pageCount":2,"componentCount":2,"difficulty":"beginner","estimatedMinutes":8,"required":true,"domainId":1001},{"id":2,"path":"static/yaml/lessons/settings_menu.yaml","title":"Settings","entityType":"lesson","pageCount":1,"componentCount":1,"difficulty":"beginner","estimatedMinutes":2,"required":true,"domainId":null},{"id":1,"path":"static/yaml/lessons/welcome_menu.yaml","title":"Welcome to Mera","entityType":"lesson","pageCount":1,"componentCount":1,"difficulty":"beginner","estimatedMinutes":5,"required":true,"domainId":null}];
 
 console.log(`Mera Registry loaded with all 12 mappings:`);
 console.log(`  - ${componentRegistrations.length} component types`);
@@ -50,6 +50,16 @@ export interface BridgeResult<T = any> {
   errorType?: BridgeErrorType;
 }
 
+// ============================================================================
+// Configuration
+// ============================================================================
+
+/**
+ * Log step-by-step session diagnostics during initialization.
+ * Off in normal use; flip on when troubleshooting authentication.
+ */
+const DEBUG_SESSION_LOGGING = false;
+
 // ============================================================================
 // MeraBridge Class
 // ============================================================================
@@ -107,54 +117,66 @@ export class MeraBridge {
     try {
       // Step 1: Get session
       this.session = getDefaultSession();
-      console.log("📍 Step 1: Initial session check:", {
-        sessionId: this.session.info.sessionId,
-        isLoggedIn: this.session.info.isLoggedIn,
-        webId: this.session.info.webId,
-      });
+      if (DEBUG_SESSION_LOGGING) {
+        const { sessionId, isLoggedIn, webId } = this.session.info;
+        console.log("📍 Step 1: Initial session check:", {
+          sessionId,
+          isLoggedIn,
+          webId,
+        });
+      }
 
       // Step 1.5: Check what's in localStorage (diagnostic)
       const solidKeys = Object.keys(localStorage).filter(
         (k) =>
           k.includes("solid") || k.includes("session") || k.includes("oidc"),
       );
-      console.log("📍 Step 1.5: localStorage investigation:", {
-        hasCurrentSession:
-          localStorage.getItem("solidClientAuthn:currentSession") !== null,
-        solidKeyCount: solidKeys.length,
-      });
+      if (DEBUG_SESSION_LOGGING) {
+        console.log("📍 Step 1.5: localStorage investigation:", {
+          hasCurrentSession:
+            localStorage.getItem("solidClientAuthn:currentSession") !== null,
+          solidKeyCount: solidKeys.length,
+        });
+      }
 
       // Step 2: Call handleIncomingRedirect with restorePreviousSession option
-      console.log("📍 Step 2: Calling handleIncomingRedirect...");
-      console.log("📍 Step 2a: URL:", window.location.href);
-      console.log(
-        "📍 Step 2b: Has OAuth params:",
-        window.location.href.includes("code="),
-      );
+      if (DEBUG_SESSION_LOGGING) {
+        console.log("📍 Step 2: Calling handleIncomingRedirect...");
+        console.log("📍 Step 2a: URL:", window.location.href);
+        console.log(
+          "📍 Step 2b: Has OAuth params:",
+          window.location.href.includes("code="),
+        );
+      }
 
       await this.session.handleIncomingRedirect({
         url: window.location.href,
         restorePreviousSession: true,
       });
-      console.log("📍 Step 3: handleIncomingRedirect completed");
+      if (DEBUG_SESSION_LOGGING) {
+        console.log("📍 Step 3: handleIncomingRedirect completed");
+      }
 
       // Step 3: Get fresh session after handleIncomingRedirect
       this.session = getDefaultSession();
-      console.log("📍 Step 4: Session after handleIncomingRedirect:", {
-        sessionId: this.session.info.sessionId,
-        isLoggedIn: this.session.info.isLoggedIn,
-        webId: this.session.info.webId,
-      });
+      const sessionInfo = this.session.info;
+      if (DEBUG_SESSION_LOGGING) {
+        console.log("📍 Step 4: Session after handleIncomingRedirect:", {
+          sessionId: sessionInfo.sessionId,
+          isLoggedIn: sessionInfo.isLoggedIn,
+          webId: sessionInfo.webId,
+        });
+      }
 
       // Step 4: Check if logged in
-      if (this.session.info.isLoggedIn) {
+      if (sessionInfo.isLoggedIn) {
         console.log("✅ User authenticated");
 
         // NEW: Ensure session marker is set for other pages to detect
-        if (this.session.info.sessionId) {
+        if (sessionInfo.sessionId) {
           localStorage.setItem(
             "solidClientAuthn:currentSession",
-            this.session.info.sessionId,
+            sessionInfo.sessionId,
           );
           console.log("📝 Stored session marker for cross-page detection");
         }
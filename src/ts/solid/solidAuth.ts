@@ -65,9 +65,28 @@ function showError(message: string): void {
   updateUI('error', message);
 }
 
+interface StatusElements {
+  loadingSection: HTMLElement | null;
+  errorSection: HTMLElement | null;
+  statusDiv: HTMLElement | null;
+}
+
+// Looked up on the first UI update and reused - the page markup is static
+let statusElements: StatusElements | null = null;
+
+function getStatusElements(): StatusElements {
+  if (!statusElements) {
+    statusElements = {
+      loadingSection: document.getElementById('loading-section'),
+      errorSection: document.getElementById('error-section'),
+      statusDiv: document.getElementById('solid-status'),
+    };
+  }
+  return statusElements;
+}
+
 function updateUI(state: 'loading' | 'error', message: string): void {
-  const loadingSection = document.getElementById('loading-section');
-  const errorSection = document.getElementById('error-section');
+  const { loadingSection, errorSection, statusDiv } = getStatusElements();
 
   [loadingSection, errorSection].forEach((section) => {
     if (section) section.classList.add('hidden');
@@ -83,6 +102,5 @@ function updateUI(state: 'loading' | 'error', message: string): void {
     if (msgEl) msgEl.textContent = message;
   }
 
-  const statusDiv = document.getElementById('solid-status');
   if (statusDiv) statusDiv.textContent = message;
 }
\ No newline at end of file
@@ -1,6 +1,6 @@
 /*
  * Auto-generated YAML File Registry for Runtime Loading
- * Generated on: 2026-02-03T21:03:10.509950
+ * Content hash: 4c27bbdc4e904d8e
  * 
  * This file contains ONLY file paths for loading YAML content at runtime.
  * All parsed data and mappings are in mera-registry.ts (bundled with TypeScript).
@@ -14,38 +14,38 @@
  */
 export const lessonFiles = [
   {
-    "path": "/static/yaml/lessons/phishing-basics-4.yaml",
-    "filename": "phishing-basics-4.yaml",
+    "path": "/static/yaml/lessons/main_menu.yaml",
+    "filename": "main_menu.yaml",
     "type": "lesson"
   },
   {
-    "path": "/static/yaml/lessons/main_menu.yaml",
-    "filename": "main_menu.yaml",
+    "path": "/static/yaml/lessons/phishing-basics-2.yaml",
+    "filename": "phishing-basics-2.yaml",
     "type": "lesson"
   },
   {
-    "path": "/static/yaml/lessons/phishing-basics.yaml",
-    "filename": "phishing-basics.yaml",
+    "path": "/static/yaml/lessons/phishing-basics-3.yaml",
+    "filename": "phishing-basics-3.yaml",
     "type": "lesson"
   },
   {
-    "path": "/static/yaml/lessons/welcome_menu.yaml",
-    "filename": "welcome_menu.yaml",
+    "path": "/static/yaml/lessons/phishing-basics-4.yaml",
+    "filename": "phishing-basics-4.yaml",
     "type": "lesson"
   },
   {
-    "path": "/static/yaml/lessons/settings_menu.yaml",
-    "filename": "settings_menu.yaml",
+    "path": "/static/yaml/lessons/phishing-basics.yaml",
+    "filename": "phishing-basics.yaml",
     "type": "lesson"
   },
   {
-    "path": "/static/yaml/lessons/phishing-basics-2.yaml",
-    "filename": "phishing-basics-2.yaml",
+    "path": "/static/yaml/lessons/settings_menu.yaml",
+    "filename": "settings_menu.yaml",
     "type": "lesson"
   },
   {
-    "path": "/static/yaml/lessons/phishing-basics-3.yaml",
-    "filename": "phishing-basics-3.yaml",
+    "path": "/static/yaml/lessons/welcome_menu.yaml",
+    "filename": "welcome_menu.yaml",
     "type": "lesson"
   }
 ];
@@ -60,8 +60,8 @@ export const curriculumFiles = [];
  */
 export const domainFiles = [
   {
-    "path": "/static/yaml/domains/domain_3_communicate_securely.yaml",
-    "filename": "domain_3_communicate_securely.yaml",
+    "path": "/static/yaml/domains/domain_1_control_activist_data.yaml",
+    "filename": "domain_1_control_activist_data.yaml",
     "type": "domain"
   },
   {
@@ -70,8 +70,8 @@ export const domainFiles = [
     "type": "domain"
   },
   {
-    "path": "/static/yaml/domains/domain_1_control_activist_data.yaml",
-    "filename": "domain_1_control_activist_data.yaml",
+    "path": "/static/yaml/domains/domain_3_communicate_securely.yaml",
+    "filename": "domain_3_communicate_securely.yaml",
     "type": "domain"
   },
   {